@@ -2,7 +2,7 @@ import logging
 from contextlib import contextmanager
 import os
 from sqlalchemy import text, create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import QueuePool
 from config.settings import Config
 
@@ -27,6 +27,7 @@ class DatabaseManager:
         # Direct SQLAlchemy support for pipeline
         self.engine = None
         self.SessionLocal = None
+        self.ScopedSession = None
         
         # Initialize direct SQLAlchemy connection for pipeline compatibility
         self._initialize_direct_connection()
@@ -47,21 +48,26 @@ class DatabaseManager:
             self.engine = create_engine(
                 self.database_url,
                 poolclass=QueuePool,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=20,
+                max_overflow=10,
                 pool_pre_ping=True,
                 pool_recycle=3600,
                 echo=Config.DEBUG,
                 connect_args=connect_args
             )
-            
+
             self.SessionLocal = sessionmaker(
                 bind=self.engine,
                 autocommit=False,
                 autoflush=False,
                 expire_on_commit=False
             )
-            
+
+            # Thread-local session registry so parallel pipeline workers
+            # reuse one session per thread instead of building a new one
+            # for every DB helper call
+            self.ScopedSession = scoped_session(self.SessionLocal)
+
             self.logger.info("Direct SQLAlchemy connection initialized")
             
         except Exception as e:
@@ -87,7 +93,8 @@ class DatabaseManager:
                     autoflush=False,
                     expire_on_commit=False
                 )
-                
+                self.ScopedSession = scoped_session(self.SessionLocal)
+
                 return True
             except Exception as e:
                 self.logger.error(f"Flask-SQLAlchemy connection failed: {e}")
@@ -100,12 +107,14 @@ class DatabaseManager:
                 # Use Flask-SQLAlchemy if available
                 with self._app.app_context():
                     self._db.create_all()
+                    self._apply_schema_upgrades(self._db.engine)
                     self.logger.info("Database tables created via Flask-SQLAlchemy")
                     return True
             elif self.engine:
                 # Use direct SQLAlchemy
                 from database.models import db
                 db.metadata.create_all(bind=self.engine)
+                self._apply_schema_upgrades(self.engine)
                 self.logger.info("Database tables created via direct SQLAlchemy")
                 return True
             else:
@@ -115,6 +124,35 @@ class DatabaseManager:
             self.logger.error(f"Table creation failed: {e}")
             return False
     
+    def _apply_schema_upgrades(self, engine):
+        """
+        Apply idempotent schema upgrades that create_all() skips because
+        the tables already exist on provisioned databases.
+        """
+        try:
+            with engine.connect() as conn:
+                # The insight upsert conflicts on (company_id, topic_id),
+                # which needs a unique index. De-duplicate rows left over
+                # from the old delete+insert path (keep the newest) before
+                # creating it on an existing table.
+                conn.execute(text(
+                    "DELETE FROM company_insights a "
+                    "USING company_insights b "
+                    "WHERE a.company_id = b.company_id "
+                    "AND a.topic_id = b.topic_id "
+                    "AND a.id < b.id"
+                ))
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS "
+                    "ix_company_insights_company_topic "
+                    "ON company_insights (company_id, topic_id)"
+                ))
+                conn.commit()
+            self.logger.info("Schema upgrades applied")
+        except Exception as e:
+            self.logger.error(f"Schema upgrade failed: {e}")
+            raise
+
     @contextmanager
     def get_session(self):
         """
@@ -145,8 +183,11 @@ class DatabaseManager:
         # Use direct SQLAlchemy session (for pipeline usage)
         if not self.SessionLocal:
             raise RuntimeError("Database not initialized")
-        
-        session = self.SessionLocal()
+
+        # Pull the session from the thread-local registry; close() releases
+        # the pooled connection while the session object itself is reused
+        # across helper calls on the same thread
+        session = self.ScopedSession()
         try:
             yield session
             session.commit()
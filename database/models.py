@@ -112,7 +112,10 @@ class TopicMention(db.Model):
 
 class CompanyInsight(db.Model):
     __tablename__ = 'company_insights'
-    
+    __table_args__ = (
+        Index('ix_company_insights_company_topic', 'company_id', 'topic_id', unique=True),
+    )
+
     id = Column(Integer, primary_key=True)
     company_id = Column(Integer, ForeignKey('companies.id'), nullable=False, index=True)
     topic_id = Column(Integer, ForeignKey('topics.id'), nullable=False, index=True)
@@ -2,15 +2,17 @@
 # scrapers/pipeline_manager.py - Complete System Orchestration
 # ============================================================================
 
-import uuid
+import secrets
+import threading
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Generator
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import json
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import desc
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from scrapers.leetcode_scraper import LeetCodeScraper
 from scrapers.glassdoor_scraper import GlassdoorScraper
 from scrapers.redit_scrapper import RedditScraper
@@ -19,10 +21,53 @@ from database.connection import db_manager
 from database.models import Company, InterviewExperience, Topic, TopicMention, CompanyInsight
 from scrapers.geeksforgeeks_scraper import GeeksforGeeksScraper
 from analysis.topic_extractor import AdvancedTopicExtractor
+from utils.company_extractor import extract_company_from_content
 from analysis.insights_generator import CompanyInsightsGenerator
 from config.settings import Config
 from utils.logger import project_logger
 
+# Built once at import; _determine_industry is called in tight
+# re-classification loops and should not rebuild this dict per call
+_INDUSTRY_MAP = {
+    # Global Tech Giants
+    'Amazon': 'Cloud/E-commerce',
+    'Google': 'Technology/Internet',
+    'Apple': 'Technology/Consumer Electronics',
+    'Netflix': 'Entertainment/Streaming',
+    'Meta': 'Social Media/Technology',
+    'Microsoft': 'Technology/Cloud',
+
+    # Indian Unicorns & Startups
+    'Flipkart': 'E-commerce',
+    'Myntra': 'E-commerce/Fashion',
+    'Carwale': 'Automotive/Technology',
+    'Swiggy': 'Food Delivery/Logistics',
+    'Zomato': 'Food Delivery/Restaurant Aggregator',
+    'Paytm': 'Fintech/Digital Payments',
+    'PhonePe': 'Fintech/Digital Payments',
+    'Razorpay': 'Fintech/Payments Gateway',
+    'Ola': 'Transportation/Mobility',
+    'Uber': 'Transportation/Mobility',
+    'Byju': 'EdTech',
+    'Unacademy': 'EdTech',
+    'Vedantu': 'EdTech',
+    'Freshworks': 'SaaS/Customer Engagement',
+    'Zoho': 'SaaS/Enterprise Software',
+    'InMobi': 'AdTech/Marketing Technology',
+    'ShareChat': 'Social Media/Regional Content',
+    'Dream11': 'Fantasy Sports/Gaming',
+    'BigBasket': 'E-commerce/Online Grocery',
+    'Grofers': 'E-commerce/Online Grocery',
+    'Dunzo': 'Hyperlocal Delivery/Logistics',
+    'Nykaa': 'E-commerce/Beauty & Lifestyle',
+    'PolicyBazaar': 'InsurTech/Fintech',
+    'MakeMyTrip': 'Travel & Tourism',
+    'BookMyShow': 'Entertainment/Ticketing',
+    'Lenskart': 'E-commerce/Eyewear',
+    'UrbanClap': 'Services/Marketplace (now Urban Company)',
+    'Cred': 'Fintech/Credit & Rewards'
+}
+
 class PipelineManager:
     """
     Complete pipeline orchestration system.
@@ -31,7 +76,7 @@ class PipelineManager:
     
     def __init__(self):
         self.logger = project_logger.get_logger('pipeline_manager')
-        self.session_id = str(uuid.uuid4())[:8]
+        self.session_id = secrets.token_hex(4)
         
         # Initialize multiple scrapers
         self.scrapers = {
@@ -59,6 +104,9 @@ class PipelineManager:
                 'reddit': {'attempted': 0, 'successful': 0}
             }
         }
+
+        # Platform and batch workers update session_stats concurrently
+        self._stats_lock = threading.Lock()
     
     def run_complete_analysis(self, company_name: str, 
                             max_experiences: int = 20,
@@ -125,7 +173,8 @@ class PipelineManager:
             recommendations = self._generate_actionable_recommendations(insights)
             results['recommendations'] = recommendations
             
-            self.session_stats['companies_processed'] += 1
+            with self._stats_lock:
+                self.session_stats['companies_processed'] += 1
             
             self.logger.info(f"Complete analysis finished for {company_name} in {performance_metrics['total_time_seconds']:.2f}s")
             
@@ -133,7 +182,8 @@ class PipelineManager:
             self.logger.error(f"Pipeline failed for {company_name}: {e}")
             results['status'] = 'error'
             results['error'] = str(e)
-            self.session_stats['errors_encountered'] += 1
+            with self._stats_lock:
+                self.session_stats['errors_encountered'] += 1
         
         return results
     
@@ -165,62 +215,92 @@ class PipelineManager:
             # Distribute scraping across platforms
             experiences_per_platform = max_experiences // len(self.scrapers)
             total_scraped = 0
-            
-            for platform_name, scraper in self.scrapers.items():
-                platform_start = time.time()
-                platform_scraped = 0
-                
-                try:
-                    self.logger.info(f"Scraping from {platform_name}...")
-                    self.session_stats['scraper_performance'][platform_name]['attempted'] += 1
-                    
-                    # Scrape experiences
-                    platform_experiences = list(scraper.scrape_company_experiences(
-                        company_name, 
-                        max_experiences=experiences_per_platform
-                    ))
-                    
-                    # Store each experience
-                    for exp_data in platform_experiences:
-                        experience_id = self._store_experience(exp_data)
-                        if experience_id:
-                            platform_scraped += 1
-                            total_scraped += 1
-                    
-                    # Record platform results
-                    collection_results['platform_results'][platform_name] = {
-                        'scraped_count': platform_scraped,
-                        'time_seconds': time.time() - platform_start,
-                        'success_rate': platform_scraped / max(len(platform_experiences), 1)
-                    }
-                    
-                    self.session_stats['scraper_performance'][platform_name]['successful'] += platform_scraped
-                    self.logger.info(f"{platform_name}: {platform_scraped} experiences")
-                    
-                except Exception as e:
-                    self.logger.error(f"{platform_name} scraping failed: {e}")
-                    collection_results['platform_results'][platform_name] = {
-                        'scraped_count': 0,
-                        'error': str(e),
-                        'time_seconds': time.time() - platform_start
-                    }
-            
+
+            # Platform scrapes are I/O bound, so overlap them instead of
+            # running the four scrapers back to back
+            with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
+                future_to_platform = {
+                    executor.submit(
+                        self._collect_from_platform,
+                        platform_name, scraper,
+                        company_name, experiences_per_platform
+                    ): platform_name
+                    for platform_name, scraper in self.scrapers.items()
+                }
+
+                for future in as_completed(future_to_platform):
+                    platform_name = future_to_platform[future]
+                    platform_result, platform_scraped = future.result()
+                    collection_results['platform_results'][platform_name] = platform_result
+                    total_scraped += platform_scraped
+
             collection_results['newly_scraped'] = total_scraped
             collection_results['scraping_performed'] = True
-            self.session_stats['experiences_scraped'] += total_scraped
+            with self._stats_lock:
+                self.session_stats['experiences_scraped'] += total_scraped
         
         collection_results['total_experiences'] = self._get_existing_experience_count(company_name)
         collection_results['collection_time_seconds'] = time.time() - stage_start
-        
+
         return collection_results
+
+    def _collect_from_platform(self, platform_name: str, scraper,
+                               company_name: str,
+                               experiences_per_platform: int) -> tuple:
+        """Scrape and store experiences from one platform (runs in a worker thread)."""
+        platform_start = time.time()
+        platform_scraped = 0
+
+        # Resolve the nested stats dict once for this platform
+        platform_perf = self.session_stats['scraper_performance'][platform_name]
+
+        try:
+            self.logger.info(f"Scraping from {platform_name}...")
+            with self._stats_lock:
+                platform_perf['attempted'] += 1
+
+            # Stream experiences straight from the generator so each
+            # one is stored as it arrives instead of buffering all in RAM
+            platform_attempted = 0
+            for exp_data in scraper.scrape_company_experiences(
+                company_name,
+                max_experiences=experiences_per_platform
+            ):
+                platform_attempted += 1
+                experience_id = self._store_experience(exp_data)
+                if experience_id:
+                    platform_scraped += 1
+
+            platform_result = {
+                'scraped_count': platform_scraped,
+                'time_seconds': time.time() - platform_start,
+                'success_rate': platform_scraped / max(platform_attempted, 1)
+            }
+
+            with self._stats_lock:
+                platform_perf['successful'] += platform_scraped
+            self.logger.info(f"{platform_name}: {platform_scraped} experiences")
+
+        except Exception as e:
+            self.logger.error(f"{platform_name} scraping failed: {e}")
+            platform_result = {
+                'scraped_count': 0,
+                'error': str(e),
+                'time_seconds': time.time() - platform_start
+            }
+
+        return platform_result, platform_scraped
     
     def _run_analysis_stage(self, company_name: str) -> Dict:
         """Run topic analysis on all experiences."""
         stage_start = time.time()
         self.logger.info(f"Stage 2: Topic Analysis for {company_name}")
         
-        # Get all experiences for the company
-        experiences = self._get_company_experiences(company_name)
+        # Get experiences still needing analysis; recently analyzed ones
+        # are filtered out in the query instead of checked row by row
+        experiences = self._get_company_experiences(
+            company_name, exclude_recently_analyzed=True
+        )
         
         analysis_results = {
             'experiences_analyzed': 0,
@@ -234,10 +314,6 @@ class PipelineManager:
         
         for experience in experiences:
             try:
-                # Skip if already analyzed recently
-                if self._is_experience_recently_analyzed(experience['id']):
-                    continue
-                
                 # Extract topics
                 topic_analysis = self.topic_extractor.extract_topics_from_experience({
                     'content': experience['content'],
@@ -260,15 +336,12 @@ class PipelineManager:
                 self.logger.error(f"Error analyzing experience {experience['id']}: {e}")
         
         # Calculate topic distribution
-        topic_counts = {}
-        for topic in topics_found:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
-        
-        analysis_results['topic_distribution'] = topic_counts
+        analysis_results['topic_distribution'] = dict(Counter(topics_found))
         analysis_results['unique_topics'] = list(analysis_results['unique_topics'])
         analysis_results['analysis_time_seconds'] = time.time() - stage_start
         
-        self.session_stats['topics_extracted'] += analysis_results['total_topics_found']
+        with self._stats_lock:
+            self.session_stats['topics_extracted'] += analysis_results['total_topics_found']
         
         return analysis_results
     
@@ -295,7 +368,8 @@ class PipelineManager:
         self._store_company_insights(company_name, insights)
         
         insights['generation_time_seconds'] = time.time() - stage_start
-        self.session_stats['insights_generated'] += 1
+        with self._stats_lock:
+            self.session_stats['insights_generated'] += 1
         
         project_logger.log_analysis_results(
             company_name,
@@ -363,12 +437,16 @@ class PipelineManager:
         # Practice strategy
         difficulty_analysis = insights.get('difficulty_analysis', {})
         primary_difficulty = difficulty_analysis.get('primary_difficulty', 'medium')
-        
+
+        # Resolve the system design check once instead of rebuilding the
+        # category list inline
+        has_system_design = any(t.split('.')[0] == 'system_design' for t in top_5_topics)
+
         recommendations['practice_strategy'] = {
             'difficulty_focus': primary_difficulty,
             'problem_solving_approach': self._get_problem_solving_strategy(primary_difficulty),
             'mock_interviews': 'Schedule 2-3 mock interviews focusing on top topics',
-            'system_design': 'Include if 3+ years experience' if 'system_design' in [t.split('.')[0] for t in top_5_topics] else 'Optional'
+            'system_design': 'Include if 3+ years experience' if has_system_design else 'Optional'
         }
         
         # Timeline recommendations
@@ -418,14 +496,16 @@ class PipelineManager:
         """Check if existing data is stale."""
         try:
             with db_manager.get_session() as session:
-                latest_experience = session.query(InterviewExperience).join(Company).filter(
+                latest_scraped_at = session.query(
+                    func.max(InterviewExperience.scraped_at)
+                ).join(Company).filter(
                     Company.name == company_name
-                ).order_by(InterviewExperience.scraped_at.desc()).first()
-                
-                if latest_experience:
-                    days_since_update = (datetime.utcnow() - latest_experience.scraped_at).days
+                ).scalar()
+
+                if latest_scraped_at:
+                    days_since_update = (datetime.utcnow() - latest_scraped_at).days
                     return days_since_update > days_threshold
-                
+
                 return True  # No data means stale
                 
         except Exception as e:
@@ -436,31 +516,33 @@ class PipelineManager:
         """Store interview experience in database."""
         try:
             with db_manager.get_session() as session:
-                # Check if experience already exists by URL to avoid duplicates
-                existing = session.query(InterviewExperience).filter(
+                # Check if experience already exists by URL to avoid duplicates;
+                # only the id is needed, so skip hydrating the row
+                existing_id = session.query(InterviewExperience.id).filter(
                     InterviewExperience.source_url == experience_data['source_url']
-                ).first()
+                ).scalar()
 
-                if existing:
+                if existing_id:
                     self.logger.debug(f"Experience already exists: {experience_data['source_url']}")
-                    return existing.id
+                    return existing_id
 
                 # Get or create company
-                company = session.query(Company).filter(
+                company_id = session.query(Company.id).filter(
                     Company.name == experience_data['company']
-                ).first()
+                ).scalar()
 
-                if not company:
+                if company_id is None:
                     company = Company(
                         name=experience_data['company'],
                         display_name=experience_data['company']
                     )
                     session.add(company)
                     session.flush()  # Keep flush here to get ID
+                    company_id = company.id
 
                 # Create experience
                 experience = InterviewExperience(
-                    company_id=company.id,
+                    company_id=company_id,
                     title=experience_data['title'],
                     content=experience_data['content'],
                     source_url=experience_data['source_url'],
@@ -482,14 +564,36 @@ class PipelineManager:
             self.logger.error(f"Error storing experience: {e}")
             return None
     
-    def _get_company_experiences(self, company_name: str) -> List[Dict]:
-        """Get all experiences for a company."""
+    def _get_company_experiences(self, company_name: str,
+                                 exclude_recently_analyzed: bool = False,
+                                 hours_threshold: int = 24,
+                                 limit: Optional[int] = None) -> List[Dict]:
+        """Get experiences for a company, fetching only the analyzed columns."""
         try:
             with db_manager.get_session() as session:
-                experiences = session.query(InterviewExperience).join(Company).filter(
+                # Select just the columns the analysis stage consumes
+                # instead of hydrating full ORM objects
+                query = session.query(
+                    InterviewExperience.id,
+                    InterviewExperience.title,
+                    InterviewExperience.content,
+                    InterviewExperience.experience_date,
+                    InterviewExperience.time_weight,
+                    InterviewExperience.source_platform
+                ).join(Company).filter(
                     Company.name == company_name
-                ).all()
-                
+                )
+
+                if exclude_recently_analyzed:
+                    analysis_cutoff = datetime.utcnow() - timedelta(hours=hours_threshold)
+                    query = query.filter(or_(
+                        InterviewExperience.processed_at.is_(None),
+                        InterviewExperience.processed_at < analysis_cutoff
+                    ))
+
+                if limit is not None:
+                    query = query.limit(limit)
+
                 return [
                     {
                         'id': exp.id,
@@ -499,43 +603,28 @@ class PipelineManager:
                         'time_weight': exp.time_weight,
                         'source_platform': exp.source_platform
                     }
-                    for exp in experiences
+                    for exp in query.all()
                 ]
                 
         except Exception as e:
             self.logger.error(f"Error getting company experiences: {e}")
             return []
     
-    def _is_experience_recently_analyzed(self, experience_id: int, hours_threshold: int = 24) -> bool:
-        """Check if experience was analyzed recently."""
-        try:
-            with db_manager.get_session() as session:
-                experience = session.query(InterviewExperience).filter(
-                    InterviewExperience.id == experience_id
-                ).first()
-                
-                if experience and experience.processed_at:
-                    hours_since = (datetime.utcnow() - experience.processed_at).total_seconds() / 3600
-                    return hours_since < hours_threshold
-                
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Error checking analysis recency: {e}")
-            return False
-    
     def _store_topic_mentions(self, experience_id: int, topics: Dict):
         """Store topic mentions for an experience."""
         try:
             with db_manager.get_session() as session:
+                # One timestamp for every row written in this batch
+                now = datetime.utcnow()
+
                 for topic_key, topic_data in topics.items():
-                    # Get or create topic
-                    topic = session.query(Topic).filter(Topic.name == topic_key).first()
-                    
-                    if not topic:
+                    # Get or create topic; only the id is needed here
+                    topic_id = session.query(Topic.id).filter(Topic.name == topic_key).scalar()
+
+                    if topic_id is None:
                         category = topic_data['category']
                         topic_name = topic_data['topic_name']
-                        
+
                         topic = Topic(
                             name=topic_key,
                             display_name=topic_name,
@@ -544,25 +633,27 @@ class PipelineManager:
                         )
                         session.add(topic)
                         session.flush()
-                    
+                        topic_id = topic.id
+
                     # Create topic mention
                     mention = TopicMention(
                         experience_id=experience_id,
-                        topic_id=topic.id,
+                        topic_id=topic_id,
                         frequency=topic_data['raw_count'],
                         importance_score=topic_data['importance_score'],
-                        confidence=topic_data.get('confidence', 0.5)
+                        confidence=topic_data.get('confidence', 0.5),
+                        detected_at=now
                     )
                     
                     session.add(mention)
                 
-                # Update experience processed timestamp
-                experience = session.query(InterviewExperience).filter(
+                # Update experience processed timestamp without fetching the row
+                session.query(InterviewExperience).filter(
                     InterviewExperience.id == experience_id
-                ).first()
-                
-                if experience:
-                    experience.processed_at = datetime.utcnow()
+                ).update(
+                    {InterviewExperience.processed_at: now},
+                    synchronize_session=False
+                )
 
                 session.commit()  # COMMIT THE TRANSACTION!
                 
@@ -573,11 +664,13 @@ class PipelineManager:
         """Get experiences with their topic analysis data."""
         try:
             with db_manager.get_session() as session:
+                # Stream in chunks rather than materialising every
+                # processed experience up front
                 experiences = session.query(InterviewExperience).join(Company).filter(
                     Company.name == company_name,
                     InterviewExperience.processed_at.isnot(None)
-                ).all()
-                
+                ).execution_options(stream_results=True).yield_per(200)
+
                 result = []
                 for exp in experiences:
                     # Get topic mentions for this experience
@@ -622,30 +715,51 @@ class PipelineManager:
                 
                 if not company:
                     return
-                
-                # Clear old insights
-                session.query(CompanyInsight).filter(
-                    CompanyInsight.company_id == company.id
-                ).delete()
-                
-                # Store new insights
-                if 'topic_insights' in insights and 'detailed_topics' in insights['topic_insights']:
-                    for topic_key, topic_data in insights['topic_insights']['detailed_topics'].items():
-                        topic = session.query(Topic).filter(Topic.name == topic_key).first()
-                        
-                        if topic:
-                            insight = CompanyInsight(
-                                company_id=company.id,
-                                topic_id=topic.id,
-                                weighted_frequency=topic_data['weighted_frequency'],
-                                confidence_score=topic_data['confidence_score'],
-                                sample_size=insights['sample_size'],
-                                priority_level=topic_data['priority_level'].lower(),
-                                study_recommendation=topic_data['actionable_insight'],
-                                analysis_date=datetime.utcnow()
-                            )
-
-                            session.add(insight)
+
+                detailed_topics = insights.get('topic_insights', {}).get('detailed_topics', {})
+                if not detailed_topics:
+                    return
+
+                # Resolve all topic ids in one query instead of per-topic lookups
+                topic_ids = dict(
+                    session.query(Topic.name, Topic.id).filter(
+                        Topic.name.in_(detailed_topics.keys())
+                    ).all()
+                )
+
+                analysis_date = datetime.utcnow()
+                values = [
+                    {
+                        'company_id': company.id,
+                        'topic_id': topic_ids[topic_key],
+                        'weighted_frequency': topic_data['weighted_frequency'],
+                        'confidence_score': topic_data['confidence_score'],
+                        'sample_size': insights['sample_size'],
+                        'priority_level': topic_data['priority_level'].lower(),
+                        'study_recommendation': topic_data['actionable_insight'],
+                        'analysis_date': analysis_date
+                    }
+                    for topic_key, topic_data in detailed_topics.items()
+                    if topic_key in topic_ids
+                ]
+
+                if not values:
+                    return
+
+                # Single UPSERT instead of DELETE + N INSERTs
+                stmt = pg_insert(CompanyInsight).values(values)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['company_id', 'topic_id'],
+                    set_={
+                        'weighted_frequency': stmt.excluded.weighted_frequency,
+                        'confidence_score': stmt.excluded.confidence_score,
+                        'sample_size': stmt.excluded.sample_size,
+                        'priority_level': stmt.excluded.priority_level,
+                        'study_recommendation': stmt.excluded.study_recommendation,
+                        'analysis_date': stmt.excluded.analysis_date
+                    }
+                )
+                session.execute(stmt)
 
                 session.commit()  # COMMIT THE TRANSACTION!
                 
@@ -664,7 +778,8 @@ class PipelineManager:
             'session_stats': self.session_stats
         }
     
-    def run_batch_analysis(self, companies: List[str], max_experiences_each: int = 20) -> Dict:
+    def run_batch_analysis(self, companies: List[str], max_experiences_each: int = 20,
+                           max_workers: int = 8) -> Dict:
         """Run analysis for multiple companies in parallel."""
         self.logger.info(f"Starting batch analysis for {len(companies)} companies")
         
@@ -677,8 +792,9 @@ class PipelineManager:
         
         start_time = time.time()
         
-        # Process companies with controlled parallelism
-        with ThreadPoolExecutor(max_workers=2) as executor:  # Conservative parallelism
+        # Process companies with controlled parallelism; each company's
+        # pipeline is independent and dominated by HTTP/DB waits
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(len(companies), 1))) as executor:
             future_to_company = {
                 executor.submit(self.run_complete_analysis, company, max_experiences_each): company
                 for company in companies
@@ -696,20 +812,27 @@ class PipelineManager:
         
         batch_results['total_time_seconds'] = time.time() - start_time
         
-        # Calculate summary statistics
-        successful_results = [r for r in batch_results['companies_processed'] if r['status'] == 'success']
-        
-        if successful_results:
-            total_experiences = sum(r['data_collection']['total_experiences'] for r in successful_results)
-            total_topics = sum(len(r['analysis_results'].get('unique_topics', [])) for r in successful_results)
-            
+        # Calculate summary statistics in one pass over the results
+        successful_count = 0
+        total_experiences = 0
+        total_topics = 0
+        total_processing_time = 0.0
+
+        for result in batch_results['companies_processed']:
+            if result['status'] != 'success':
+                continue
+            successful_count += 1
+            total_experiences += result['data_collection']['total_experiences']
+            total_topics += len(result['analysis_results'].get('unique_topics', []))
+            total_processing_time += result['performance_metrics']['total_time_seconds']
+
+        if successful_count:
             batch_results['summary_stats'] = {
-                'successful_companies': len(successful_results),
+                'successful_companies': successful_count,
                 'failed_companies': len(batch_results['errors']),
                 'total_experiences_analyzed': total_experiences,
                 'total_unique_topics_found': total_topics,
-                'average_processing_time': sum(r['performance_metrics']['total_time_seconds'] 
-                                             for r in successful_results) / len(successful_results)
+                'average_processing_time': total_processing_time / successful_count
             }
         
         self.logger.info(f"Batch analysis completed: {batch_results['summary_stats']}")
@@ -734,15 +857,24 @@ class PipelineManager:
                 if hasattr(scraper, 'rate_limiter'):
                     health_metrics['scraper_stats'][f'{platform}_rate_limiter'] = scraper.rate_limiter.get_stats()
             
-            # Database metrics
+            # Database metrics - all four counts as scalar subqueries of a
+            # single SELECT, one round-trip instead of four COUNT queries
             with db_manager.get_session() as session:
+                recent_cutoff = datetime.utcnow() - timedelta(days=7)
+                total_companies, total_experiences, total_topics, recent_scrapes = session.query(
+                    session.query(func.count(Company.id)).scalar_subquery(),
+                    session.query(func.count(InterviewExperience.id)).scalar_subquery(),
+                    session.query(func.count(Topic.id)).scalar_subquery(),
+                    session.query(func.count(InterviewExperience.id)).filter(
+                        InterviewExperience.scraped_at >= recent_cutoff
+                    ).scalar_subquery()
+                ).one()
+
                 health_metrics['system_performance'] = {
-                    'total_companies': session.query(Company).count(),
-                    'total_experiences': session.query(InterviewExperience).count(),
-                    'total_topics': session.query(Topic).count(),
-                    'recent_scrapes': session.query(InterviewExperience).filter(
-                        InterviewExperience.scraped_at >= datetime.utcnow() - timedelta(days=7)
-                    ).count()
+                    'total_companies': total_companies,
+                    'total_experiences': total_experiences,
+                    'total_topics': total_topics,
+                    'recent_scrapes': recent_scrapes
                 }
             
             return health_metrics
@@ -755,18 +887,16 @@ class PipelineManager:
         """Clean up experiences with 'Unknown' company names."""
         try:
             with db_manager.get_session() as session:
-                # Get all experiences with 'Unknown' company
-                unknown_company = session.query(Company).filter(Company.name == 'Unknown').first()
-                if unknown_company:
-                    unknown_experiences = session.query(InterviewExperience).filter(
-                        InterviewExperience.company_id == unknown_company.id
-                    ).all()
-                    
-                    self.logger.info(f"Found {len(unknown_experiences)} experiences with Unknown company")
-                    
+                # Presence checks only need the id, not the full row
+                unknown_company_id = session.query(Company.id).filter(
+                    Company.name == 'Unknown'
+                ).scalar()
+                if unknown_company_id is not None:
                     # Get Amazon company (create if doesn't exist)
-                    amazon_company = session.query(Company).filter(Company.name == 'Amazon').first()
-                    if not amazon_company:
+                    amazon_company_id = session.query(Company.id).filter(
+                        Company.name == 'Amazon'
+                    ).scalar()
+                    if amazon_company_id is None:
                         amazon_company = Company(
                             name='Amazon',
                             display_name='Amazon',
@@ -775,13 +905,18 @@ class PipelineManager:
                         )
                         session.add(amazon_company)
                         session.flush()
-                    
-                    # Re-assign unknown experiences to Amazon
-                    for exp in unknown_experiences:
-                        exp.company_id = amazon_company.id
-                    
+                        amazon_company_id = amazon_company.id
+
+                    # Re-assign all unknown experiences with one UPDATE
+                    reassigned = session.query(InterviewExperience).filter(
+                        InterviewExperience.company_id == unknown_company_id
+                    ).update(
+                        {InterviewExperience.company_id: amazon_company_id},
+                        synchronize_session=False
+                    )
+
                     session.commit()
-                    self.logger.info(f"Reassigned {len(unknown_experiences)} experiences to Amazon")
+                    self.logger.info(f"Reassigned {reassigned} experiences to Amazon")
                     
         except Exception as e:
             self.logger.error(f"Error cleaning up unknown companies: {e}")
@@ -790,50 +925,84 @@ class PipelineManager:
         """Fix existing 'Unknown' company entries by re-analyzing their content."""
         try:
             with db_manager.get_session() as session:
-                # Get Unknown company
-                unknown_company = session.query(Company).filter(Company.name == 'Unknown').first()
-                if not unknown_company:
+                # Get Unknown company; only the id is needed
+                unknown_company_id = session.query(Company.id).filter(
+                    Company.name == 'Unknown'
+                ).scalar()
+                if unknown_company_id is None:
                     self.logger.info("No 'Unknown' company found")
                     return
                 
-                # Get all experiences with Unknown company
-                unknown_experiences = session.query(InterviewExperience).filter(
-                    InterviewExperience.company_id == unknown_company.id
-                ).all()
-                
-                self.logger.info(f"Found {len(unknown_experiences)} experiences to re-classify")
-                
+                # Only id/title/content are read during re-classification,
+                # so stream those columns in chunks instead of materialising
+                # full ORM rows for every Unknown experience
+                unknown_experiences = session.query(
+                    InterviewExperience.id,
+                    InterviewExperience.title,
+                    InterviewExperience.content
+                ).filter(
+                    InterviewExperience.company_id == unknown_company_id
+                ).execution_options(stream_results=True).yield_per(1000)
+
                 company_reassignments = {}
-                
+                scanned_count = 0
+
                 for exp in unknown_experiences:
+                    scanned_count += 1
+
                     # Re-extract company name using improved method
                     detected_company = self._re_extract_company_name(exp.title, exp.content)
-                    
+
                     if detected_company != "Unknown":
                         if detected_company not in company_reassignments:
                             company_reassignments[detected_company] = []
-                        company_reassignments[detected_company].append(exp)
-                
-                # Create/update companies and reassign experiences
-                for company_name, experiences in company_reassignments.items():
-                    # Get or create company
-                    company = session.query(Company).filter(Company.name == company_name).first()
-                    if not company:
-                        company = Company(
-                            name=company_name,
-                            display_name=company_name,
-                            industry=self._determine_industry(company_name),
-                            size='medium'
-                        )
-                        session.add(company)
-                        session.flush()
-                        self.logger.info(f"Created new company: {company_name}")
-                    
-                    # Reassign experiences
-                    for exp in experiences:
-                        exp.company_id = company.id
-                    
-                    self.logger.info(f"Reassigned {len(experiences)} experiences to {company_name}")
+                        company_reassignments[detected_company].append(exp.id)
+
+                self.logger.info(f"Scanned {scanned_count} experiences to re-classify")
+
+                if not company_reassignments:
+                    self.logger.info("No experiences could be re-classified")
+                    return
+
+                # Resolve every target company in one query and bulk-insert
+                # the missing ones, instead of a SELECT + INSERT + flush
+                # round-trip per new company
+                target_names = list(company_reassignments.keys())
+                company_ids = dict(
+                    session.query(Company.name, Company.id).filter(
+                        Company.name.in_(target_names)
+                    ).all()
+                )
+
+                missing_names = [name for name in target_names if name not in company_ids]
+                if missing_names:
+                    session.bulk_insert_mappings(Company, [
+                        {
+                            'name': name,
+                            'display_name': name,
+                            'industry': self._determine_industry(name),
+                            'size': 'medium'
+                        }
+                        for name in missing_names
+                    ])
+                    company_ids.update(
+                        session.query(Company.name, Company.id).filter(
+                            Company.name.in_(missing_names)
+                        ).all()
+                    )
+                    self.logger.info(f"Created new companies: {missing_names}")
+
+                # Reassign with one UPDATE ... WHERE id IN (...) per company
+                # instead of a dirty-object UPDATE per experience
+                for company_name, experience_ids in company_reassignments.items():
+                    session.query(InterviewExperience).filter(
+                        InterviewExperience.id.in_(experience_ids)
+                    ).update(
+                        {InterviewExperience.company_id: company_ids[company_name]},
+                        synchronize_session=False
+                    )
+
+                    self.logger.info(f"Reassigned {len(experience_ids)} experiences to {company_name}")
                 
                 session.commit()
                 self.logger.info("Company reassignment completed")
@@ -842,53 +1011,12 @@ class PipelineManager:
             self.logger.error(f"Error fixing unknown companies: {e}")
 
     def _re_extract_company_name(self, title: str, content: str) -> str:
-        """Re-extract company name using the improved method."""
-        # Use the same improved extraction logic
-        return self._extract_company_from_content(title, content)
+        """Re-extract company name using the centralized extraction service."""
+        return extract_company_from_content(title, content)
     
     def _determine_industry(self, company_name: str) -> str:
         """Determine industry based on company name."""
-        industry_mapping = {
-            # Global Tech Giants
-            'Amazon': 'Cloud/E-commerce',
-            'Google': 'Technology/Internet',
-            'Apple': 'Technology/Consumer Electronics',
-            'Netflix': 'Entertainment/Streaming',
-            'Meta': 'Social Media/Technology',
-            'Microsoft': 'Technology/Cloud',
-
-            # Indian Unicorns & Startups
-            'Flipkart': 'E-commerce',
-            'Myntra': 'E-commerce/Fashion',
-            'Carwale': 'Automotive/Technology',
-            'Swiggy': 'Food Delivery/Logistics',
-            'Zomato': 'Food Delivery/Restaurant Aggregator',
-            'Paytm': 'Fintech/Digital Payments',
-            'PhonePe': 'Fintech/Digital Payments',
-            'Razorpay': 'Fintech/Payments Gateway',
-            'Ola': 'Transportation/Mobility',
-            'Uber': 'Transportation/Mobility',
-            'Byju': 'EdTech',
-            'Unacademy': 'EdTech',
-            'Vedantu': 'EdTech',
-            'Freshworks': 'SaaS/Customer Engagement',
-            'Zoho': 'SaaS/Enterprise Software',
-            'InMobi': 'AdTech/Marketing Technology',
-            'ShareChat': 'Social Media/Regional Content',
-            'Dream11': 'Fantasy Sports/Gaming',
-            'BigBasket': 'E-commerce/Online Grocery',
-            'Grofers': 'E-commerce/Online Grocery',
-            'Dunzo': 'Hyperlocal Delivery/Logistics',
-            'Nykaa': 'E-commerce/Beauty & Lifestyle',
-            'PolicyBazaar': 'InsurTech/Fintech',
-            'MakeMyTrip': 'Travel & Tourism',
-            'BookMyShow': 'Entertainment/Ticketing',
-            'Lenskart': 'E-commerce/Eyewear',
-            'UrbanClap': 'Services/Marketplace (now Urban Company)',
-            'Cred': 'Fintech/Credit & Rewards'
-        }
-
-        return industry_mapping.get(company_name, 'Technology')
+        return _INDUSTRY_MAP.get(company_name, 'Technology')
 
 # ============================================================================
 # API Integration Point
@@ -1,20 +1,131 @@
 import re
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 from urllib.parse import urljoin, quote
 from scrapers.base_scraper import BaseScraper
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Generator
 from config.settings import Config
 
 
+# Precompiled once at import; these run for every candidate post.
+# Single alternation so the text is scanned once instead of per pattern.
+_INTERVIEW_RE = re.compile(
+    r'\binterview\s+experience\b'
+    r'|\binterview\s+(?:process|round|question)\b'
+    r'|\b(?:onsite|phone|technical|coding|behavioral)\s+interview\b'
+    r'|\b(?:got|received|rejected)\s+(?:offer|rejection)\b'
+    r'|\binterview\s+(?:failed|passed|cleared)\b'
+    r'|\bhired\s+at\b'
+    r'|\boffered\s+position\b'
+)
+
+_ROUND_COUNT_RE = re.compile(r'round\s*(\d+)|(\d+)\s*round|interview\s*(\d+)')
+
+# Keyword groups fused into one alternation each, so classification is a
+# single scan over the post instead of one substring search per keyword
+_DIFFICULTY_RE = re.compile(
+    r'(?P<easy>easy|simple|basic|straightforward)'
+    r'|(?P<medium>medium|moderate|intermediate|standard)'
+    r'|(?P<hard>hard|difficult|challenging|tough|complex)'
+)
+
+_OUTCOME_RE = re.compile(
+    r'(?P<offer>got the offer|selected|hired|offer letter|accepted'
+    r'|joined|success|got offer|received offer)'
+    r"|(?P<rejected>rejected|not selected|failed|did not get"
+    r"|unsuccessful|didn't make it|no offer)"
+)
+
+_FALSE_POSITIVE_RE = re.compile(
+    r'hiring|job posting|salary negotiation|company culture'
+    r'|benefits|work life balance|resignation|performance review'
+)
+
+# Role buckets in priority order, each collapsed into one compiled
+# alternation; the first bucket with a hit wins, preserving the old
+# substring semantics with one scan per bucket instead of one per keyword
+_ROLE_PATTERNS = (
+    ('SDE Intern', re.compile(r'intern|internship|summer intern|new grad')),
+    ('Senior SDE', re.compile(r'senior|staff|principal|l6|l7|senior sde')),
+    ('SDE-3', re.compile(r'sde-3|sde 3|senior sde|staff engineer')),
+    ('SDE-2', re.compile(r'sde-2|sde 2|sde ii|mid level|l5')),
+    ('SDE-1', re.compile(r'sde-1|sde 1|sde i|junior|l4')),
+    ('SDE', re.compile(r'sde|software development engineer|software developer|software engineer')),
+)
+
+
+# Expanded company name mappings including Indian companies, built once
+# at import time
+_COMPANY_MAPPINGS = {
+    # International Companies
+    'Amazon': ['amazon', 'amzn', 'aws', 'amazon.com', 'amazon inc'],
+    'Google': ['google', 'alphabet', 'goog', 'google.com', 'alphabet inc'],
+    'Apple': ['apple', 'aapl', 'apple inc', 'apple.com'],
+    'Netflix': ['netflix', 'nflx', 'netflix.com', 'netflix inc'],
+    'Meta': ['meta', 'facebook', 'fb', 'instagram', 'whatsapp', 'meta platforms'],
+    'Microsoft': ['microsoft', 'msft', 'ms', 'microsoft.com', 'microsoft corporation'],
+
+    # Indian Companies
+    'Flipkart': ['flipkart', 'flipkart.com', 'flipkart india'],
+    'Carwale': ['carwale', 'carwale.com', 'car wale'],
+    'Swiggy': ['swiggy', 'swiggy.com'],
+    'Zomato': ['zomato', 'zomato.com'],
+    'Paytm': ['paytm', 'paytm.com', 'one97'],
+    'Ola': ['ola', 'ola cabs', 'ola.com'],
+    'Uber': ['uber', 'uber.com'],
+    'Byju': ['byju', 'byjus', 'byju\'s'],
+    'Razorpay': ['razorpay', 'razorpay.com'],
+    'Freshworks': ['freshworks', 'freshdesk', 'freshservice'],
+    'Zoho': ['zoho', 'zoho.com'],
+    'InMobi': ['inmobi', 'inmobi.com'],
+    'ShareChat': ['sharechat', 'share chat'],
+    'Dream11': ['dream11', 'dream 11'],
+    'PhonePe': ['phonepe', 'phone pe'],
+    'Myntra': ['myntra', 'myntra.com'],
+    'BigBasket': ['bigbasket', 'big basket'],
+    'Grofers': ['grofers', 'blinkit'],
+    'Dunzo': ['dunzo', 'dunzo.com'],
+    'Nykaa': ['nykaa', 'nykaa.com'],
+    'PolicyBazaar': ['policybazaar', 'policy bazaar'],
+    'MakeMyTrip': ['makemytrip', 'make my trip', 'mmt'],
+    'BookMyShow': ['bookmyshow', 'book my show', 'bms'],
+    'Lenskart': ['lenskart', 'lenskart.com'],
+    'UrbanClap': ['urbanclap', 'urban clap', 'urbancompany', 'urban company'],
+    'Cred': ['cred', 'cred.com'],
+    'Unacademy': ['unacademy', 'unacademy.com'],
+    'Vedantu': ['vedantu', 'vedantu.com']
+}
+
+# Inverted alias -> canonical index plus one compiled alternation over
+# every alias, so a post is classified in a single scan instead of a
+# substring check per company per alias. Longest aliases first so
+# multi-word names like 'phone pe' win over their prefixes.
+_ALIAS_TO_COMPANY = {
+    alias: canonical
+    for canonical, aliases in _COMPANY_MAPPINGS.items()
+    for alias in aliases
+}
+_ALIAS_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(alias) for alias in sorted(_ALIAS_TO_COMPANY, key=len, reverse=True)
+    ) + r')\b'
+)
+
+
 class RedditScraper(BaseScraper):
     """
     Advanced Reddit scraper for interview experiences.
     Updated to match GeeksforGeeks scraper format with enhanced functionality.
     """
 
+    company_mappings = _COMPANY_MAPPINGS
+
     def __init__(self):
         super().__init__('reddit')
         self.base_url = 'https://www.reddit.com'
@@ -22,53 +133,83 @@ class RedditScraper(BaseScraper):
         # Use Reddit's JSON API (no auth required for public posts)
         self.api_base = 'https://www.reddit.com/r'
 
-        # Expanded company name mappings including Indian companies
-        self.company_mappings = {
-            # International Companies
-            'Amazon': ['amazon', 'amzn', 'aws', 'amazon.com', 'amazon inc'],
-            'Google': ['google', 'alphabet', 'goog', 'google.com', 'alphabet inc'],
-            'Apple': ['apple', 'aapl', 'apple inc', 'apple.com'],
-            'Netflix': ['netflix', 'nflx', 'netflix.com', 'netflix inc'],
-            'Meta': ['meta', 'facebook', 'fb', 'instagram', 'whatsapp', 'meta platforms'],
-            'Microsoft': ['microsoft', 'msft', 'ms', 'microsoft.com', 'microsoft corporation'],
-
-            # Indian Companies
-            'Flipkart': ['flipkart', 'flipkart.com', 'flipkart india'],
-            'Carwale': ['carwale', 'carwale.com', 'car wale'],
-            'Swiggy': ['swiggy', 'swiggy.com'],
-            'Zomato': ['zomato', 'zomato.com'],
-            'Paytm': ['paytm', 'paytm.com', 'one97'],
-            'Ola': ['ola', 'ola cabs', 'ola.com'],
-            'Uber': ['uber', 'uber.com'],
-            'Byju': ['byju', 'byjus', 'byju\'s'],
-            'Razorpay': ['razorpay', 'razorpay.com'],
-            'Freshworks': ['freshworks', 'freshdesk', 'freshservice'],
-            'Zoho': ['zoho', 'zoho.com'],
-            'InMobi': ['inmobi', 'inmobi.com'],
-            'ShareChat': ['sharechat', 'share chat'],
-            'Dream11': ['dream11', 'dream 11'],
-            'PhonePe': ['phonepe', 'phone pe'],
-            'Myntra': ['myntra', 'myntra.com'],
-            'BigBasket': ['bigbasket', 'big basket'],
-            'Grofers': ['grofers', 'blinkit'],
-            'Dunzo': ['dunzo', 'dunzo.com'],
-            'Nykaa': ['nykaa', 'nykaa.com'],
-            'PolicyBazaar': ['policybazaar', 'policy bazaar'],
-            'MakeMyTrip': ['makemytrip', 'make my trip', 'mmt'],
-            'BookMyShow': ['bookmyshow', 'book my show', 'bms'],
-            'Lenskart': ['lenskart', 'lenskart.com'],
-            'UrbanClap': ['urbanclap', 'urban clap', 'urbancompany', 'urban company'],
-            'Cred': ['cred', 'cred.com'],
-            'Unacademy': ['unacademy', 'unacademy.com'],
-            'Vedantu': ['vedantu', 'vedantu.com']
-        }
-
         # Enhanced headers for Reddit
         self.session.headers.update({
             'User-Agent': 'Interview Intelligence Research Bot 1.0 (Educational Use)',
             'Accept': 'application/json'
         })
 
+        # Nearly every request targets www.reddit.com, so keep a pool of
+        # warm keep-alive connections sized for the worker threads and
+        # retry transient 5xx responses with backoff (403/429 handling
+        # stays in safe_request)
+        self.session.mount('https://www.reddit.com', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[500, 502, 503, 504])
+        ))
+
+    def scrape_company_experiences(self, company: str, max_experiences: int = 50) -> Generator[Dict, None, None]:
+        """
+        Reddit-specific scraping pipeline.
+
+        Post detail fetches are independent JSON GETs, so they are fanned
+        out across worker threads and yielded as they land instead of one
+        request per round-trip.
+        """
+        self.logger.info(f"Starting {company} experience collection on {self.platform_name}")
+
+        # Discover URLs
+        urls = self.discover_experience_urls(company, max_pages=20)
+        self.logger.info(f"Found {len(urls)} potential URLs")
+
+        scraped_count = 0
+        executor = ThreadPoolExecutor(max_workers=8)
+        try:
+            futures = [
+                executor.submit(self.extract_experience_data, url, company)
+                for url in urls
+            ]
+
+            for future in as_completed(futures):
+                if scraped_count >= max_experiences:
+                    break
+
+                try:
+                    experience_data = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Post detail fetch failed: {e}")
+                    continue
+
+                if not experience_data:
+                    continue
+
+                # Check for duplicate content
+                if self.is_duplicate_content(experience_data['content']):
+                    self.stats['duplicates_found'] += 1
+                    continue
+
+                # Add metadata
+                experience_data.update({
+                    'source_platform': self.platform_name,
+                    'scraped_at': datetime.utcnow(),
+                    'time_weight': self.decay_calculator.calculate_weight(
+                        experience_data.get('experience_date', datetime.utcnow())
+                    )
+                })
+
+                yield experience_data
+                scraped_count += 1
+
+                self.logger.info(f"Scraped {scraped_count}/{max_experiences}: {experience_data['title'][:50]}...")
+        finally:
+            # Drop any fetches still queued once the cap is reached
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.logger.info(f"Completed {company} scraping: {scraped_count} unique experiences")
+        self._log_stats()
+
     def discover_experience_urls(self, company: str, max_pages: int = 10) -> List[str]:
         """Discover interview experience URLs using multiple strategies."""
         urls = set()  # Use set to avoid duplicates
@@ -84,10 +225,55 @@ class RedditScraper(BaseScraper):
 
         return list(urls)
 
-    def _search_multiple_subreddits(self, company: str, max_pages: int) -> set:
-        """Search multiple relevant subreddits for interview experiences."""
+    def _run_subreddit_search(self, subreddit: str, params: Dict, company: str) -> set:
+        """Run one subreddit search query and collect matching post URLs."""
+        urls = set()
+
+        search_url = f"{self.api_base}/{subreddit}/search.json"
+        response = self.safe_request(search_url, params=params)
+        if not response:
+            return urls
+
+        try:
+            data = response.json()
+            posts = data.get('data', {}).get('children', [])
+
+            for post in posts:
+                post_data = post.get('data', {})
+                permalink = post_data.get('permalink')
+
+                if permalink and self._is_interview_experience_post(post_data, company):
+                    urls.add(f"https://www.reddit.com{permalink}")
+
+        except Exception as e:
+            self.logger.warning(f"Error parsing Reddit JSON for {subreddit}: {e}")
+
+        return urls
+
+    def _run_search_queries(self, queries: List[Tuple[str, Dict]], company: str) -> set:
+        """Fan independent subreddit searches out across worker threads."""
         urls = set()
+        if not queries:
+            return urls
+
+        # Each query is an independent round-trip to Reddit's search API,
+        # so overlap them; the shared rate limiter still paces the domain
+        with ThreadPoolExecutor(max_workers=min(8, len(queries))) as executor:
+            futures = [
+                executor.submit(self._run_subreddit_search, subreddit, params, company)
+                for subreddit, params in queries
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    urls.update(future.result())
+                except Exception as e:
+                    self.logger.warning(f"Subreddit search failed: {e}")
+
+        return urls
 
+    def _search_multiple_subreddits(self, company: str, max_pages: int) -> set:
+        """Search multiple relevant subreddits for interview experiences."""
         subreddits = [
             'cscareerquestions',
             'ExperiencedDevs',
@@ -107,43 +293,22 @@ class RedditScraper(BaseScraper):
             f'{company} phone screen'
         ]
 
-        for subreddit in subreddits:
-            for search_term in search_terms:
-                # Use Reddit's search API
-                search_url = f"{self.api_base}/{subreddit}/search.json"
-                params = {
-                    'q': search_term,
-                    'restrict_sr': 'on',
-                    'sort': 'relevance',
-                    'limit': 25,
-                    't': 'all'  # All time
-                }
-
-                response = self.safe_request(search_url, params=params)
-                if not response:
-                    continue
-
-                try:
-                    data = response.json()
-                    posts = data.get('data', {}).get('children', [])
-
-                    for post in posts:
-                        post_data = post.get('data', {})
-                        permalink = post_data.get('permalink')
-
-                        if permalink and self._is_interview_experience_post(post_data, company):
-                            full_url = f"https://www.reddit.com{permalink}"
-                            urls.add(full_url)
-
-                except Exception as e:
-                    self.logger.warning(f"Error parsing Reddit JSON for {subreddit}: {e}")
+        queries = [
+            (subreddit, {
+                'q': search_term,
+                'restrict_sr': 'on',
+                'sort': 'relevance',
+                'limit': 25,
+                't': 'all'  # All time
+            })
+            for subreddit in subreddits
+            for search_term in search_terms
+        ]
 
-        return urls
+        return self._run_search_queries(queries, company)
 
     def _search_company_subreddit(self, company: str) -> set:
         """Search company-specific subreddits."""
-        urls = set()
-
         # Check if company has its own subreddit
         company_subreddits = [
             company.lower(),
@@ -151,130 +316,74 @@ class RedditScraper(BaseScraper):
             f"{company.lower()}employees"
         ]
 
-        for subreddit_name in company_subreddits:
-            search_url = f"{self.api_base}/{subreddit_name}/search.json"
-            params = {
+        queries = [
+            (subreddit_name, {
                 'q': 'interview experience',
                 'restrict_sr': 'on',
                 'sort': 'relevance',
                 'limit': 20
-            }
-
-            response = self.safe_request(search_url, params=params)
-            if not response:
-                continue
-
-            try:
-                data = response.json()
-                posts = data.get('data', {}).get('children', [])
-
-                for post in posts:
-                    post_data = post.get('data', {})
-                    permalink = post_data.get('permalink')
-
-                    if permalink and self._is_interview_experience_post(post_data, company):
-                        full_url = f"https://www.reddit.com{permalink}"
-                        urls.add(full_url)
-
-            except Exception as e:
-                self.logger.warning(f"Error searching company subreddit {subreddit_name}: {e}")
+            })
+            for subreddit_name in company_subreddits
+        ]
 
-        return urls
+        return self._run_search_queries(queries, company)
 
     def _get_recent_career_posts(self, company: str) -> set:
         """Get recent posts from career-focused subreddits with targeted search."""
-        urls = set()
-
         career_subreddits = ['cscareerquestions', 'ExperiencedDevs']
 
-        for subreddit in career_subreddits:
-            # Use targeted search instead of browsing all new posts
-            search_url = f"{self.api_base}/{subreddit}/search.json"
-
-            # Search with specific company + interview terms
-            search_queries = [
-                f'"{company}" interview',
-                f'{company} interview experience',
-                f'{company} coding interview'
-            ]
-
-            for query in search_queries:
-                params = {
-                    'q': query,
-                    'restrict_sr': 'on',
-                    'sort': 'relevance',
-                    'limit': 25,
-                    't': 'year'  # Limit to past year for relevancy
-                }
-
-                response = self.safe_request(search_url, params=params)
-                if not response:
-                    continue
-
-                try:
-                    data = response.json()
-                    posts = data.get('data', {}).get('children', [])
-
-                    for post in posts:
-                        post_data = post.get('data', {})
-                        if self._is_interview_experience_post(post_data, company):
-                            permalink = post_data.get('permalink')
-                            if permalink:
-                                full_url = f"https://www.reddit.com{permalink}"
-                                urls.add(full_url)
+        # Search with specific company + interview terms
+        search_queries = [
+            f'"{company}" interview',
+            f'{company} interview experience',
+            f'{company} coding interview'
+        ]
 
-                except Exception as e:
-                    self.logger.warning(f"Error searching {subreddit} for {query}: {e}")
+        queries = [
+            (subreddit, {
+                'q': query,
+                'restrict_sr': 'on',
+                'sort': 'relevance',
+                'limit': 25,
+                't': 'year'  # Limit to past year for relevancy
+            })
+            for subreddit in career_subreddits
+            for query in search_queries
+        ]
 
-        return urls
+        return self._run_search_queries(queries, company)
 
     def _is_interview_experience_post(self, post_data: Dict, company: str) -> bool:
         """Enhanced check if Reddit post is an interview experience."""
         title = post_data.get('title', '').lower()
         selftext = post_data.get('selftext', '').lower()
 
-        # Use centralized company extraction for better accuracy
-        from utils.company_extractor import extract_company_from_content
-
-        # Extract company from post content
-        extracted_company = extract_company_from_content(title, selftext, company)
-
-        # Must match the target company exactly
-        company_match = extracted_company == company
-
-        # Stronger interview keyword matching with word boundaries
-        import re
-        interview_patterns = [
-            r'\binterview\s+experience\b',
-            r'\binterview\s+(process|round|question)\b',
-            r'\b(onsite|phone|technical|coding|behavioral)\s+interview\b',
-            r'\b(got|received|rejected)\s+(offer|rejection)\b',
-            r'\binterview\s+(failed|passed|cleared)\b',
-            r'\bhired\s+at\b',
-            r'\boffered\s+position\b'
-        ]
+        # Cheapest check first: too-short posts never qualify, so they
+        # skip every pattern scan below
+        if len(title) + len(selftext) <= 150:  # Increased minimum
+            return False
 
-        # Check if any interview pattern matches in title or content
         full_text = f"{title} {selftext}"
-        interview_match = any(re.search(pattern, full_text) for pattern in interview_patterns)
 
-        # Additional quality checks
-        min_content_length = len(title) + len(selftext) > 150  # Increased minimum
+        # Must mention the target company, by name or via one scan of the
+        # inverted alias index (instead of checking every company's
+        # aliases separately)
+        if company.lower() not in full_text and company not in {
+            _ALIAS_TO_COMPANY[match.group(0)] for match in _ALIAS_RE.finditer(full_text)
+        }:
+            return False
 
-        # Avoid common false positives
-        false_positive_keywords = [
-            'hiring', 'job posting', 'salary negotiation', 'company culture',
-            'benefits', 'work life balance', 'resignation', 'performance review'
-        ]
-        is_false_positive = any(keyword in full_text for keyword in false_positive_keywords)
-
-        # Must have company match AND interview keywords AND good length AND not false positive
-        result = company_match and interview_match and min_content_length and not is_false_positive
+        # Stronger interview keyword matching with word boundaries;
+        # one pass with the precompiled alternation
+        if not _INTERVIEW_RE.search(full_text):
+            return False
 
-        if result:
-            self.logger.debug(f"Valid interview post found: {title[:50]}... for {company}")
+        # Avoid common false positives
+        if _FALSE_POSITIVE_RE.search(full_text):
+            return False
 
-        return result
+        self.logger.debug(f"Valid interview post found: {title[:50]}... for {company}")
+        return True
 
     def extract_experience_data(self, url: str, target_company: str = None) -> Optional[Dict]:
         """Extract structured data from Reddit post."""
@@ -300,13 +409,18 @@ class RedditScraper(BaseScraper):
             if not content or len(content) < 100:  # Skip very short content
                 return None
 
+            # Lowercase once per post; every extractor below searches this
+            # same normalized text
+            content_lower = content.lower()
+            text_lower = title.lower() + " " + content_lower
+
             # Extract metadata
             experience_date = self._extract_date_from_timestamp(post_data.get('created_utc'))
             company = self._extract_company_from_content(title, content, target_company)
-            role = self._extract_role_from_content(title, content)
+            role = self._extract_role_from_content(text_lower)
 
             # Extract interview rounds information
-            rounds_info = self._extract_rounds_info(content)
+            rounds_info = self._extract_rounds_info(content, content_lower)
 
             return {
                 'title': title,
@@ -318,8 +432,8 @@ class RedditScraper(BaseScraper):
                 'experience_date': experience_date,
                 'rounds_count': rounds_info['count'],
                 'rounds_details': rounds_info['details'],
-                'difficulty_indicators': self._extract_difficulty_indicators(content),
-                'outcome': self._extract_outcome(content),
+                'difficulty_indicators': self._extract_difficulty_indicators(content_lower),
+                'outcome': self._extract_outcome(content_lower),
                 'upvotes': post_data.get('ups', 0),
                 'comments_count': post_data.get('num_comments', 0),
                 'time_weight': self._calculate_time_weight(experience_date),
@@ -342,52 +456,48 @@ class RedditScraper(BaseScraper):
         from utils.company_extractor import extract_company_from_content
         return extract_company_from_content(title, content, target_company)
 
-    def _extract_role_from_content(self, title: str, content: str) -> str:
-        """Extract role information."""
-        text = (title + " " + content).lower()
-
-        role_patterns = {
-            'SDE Intern': ['intern', 'internship', 'summer intern', 'new grad'],
-            'Senior SDE': ['senior', 'staff', 'principal', 'l6', 'l7', 'senior sde'],
-            'SDE-3': ['sde-3', 'sde 3', 'senior sde', 'staff engineer'],
-            'SDE-2': ['sde-2', 'sde 2', 'sde ii', 'mid level', 'l5'],
-            'SDE-1': ['sde-1', 'sde 1', 'sde i', 'junior', 'l4'],
-            'SDE': ['sde', 'software development engineer', 'software developer', 'software engineer']
-        }
-
-        for role, patterns in role_patterns.items():
-            if any(pattern in text for pattern in patterns):
+    def _extract_role_from_content(self, text_lower: str) -> str:
+        """Extract role information from pre-lowercased title + content."""
+        for role, pattern in _ROLE_PATTERNS:
+            if pattern.search(text_lower):
                 return role
 
         return "Software Engineer"
 
-    def _extract_rounds_info(self, content: str) -> Dict:
-        """Extract information about interview rounds."""
-        content_lower = content.lower()
+    def _extract_rounds_info(self, content: str, content_lower: str) -> Dict:
+        """Extract information about interview rounds.
 
-        # Count round mentions
-        round_patterns = [
-            r'round\s*(\d+)',
-            r'(\d+)\s*round',
-            r'round\s*[:\-]',
-            r'interview\s*(\d+)',
-        ]
+        Takes the original content (for section slices) alongside its
+        pre-lowercased form so the caller lowercases only once.
+        """
+        # Posts this short never describe multiple rounds
+        if len(content) < 200:
+            return {'count': 1, 'details': []}
 
+        # One pass with the precompiled alternation: the matching
+        # alternative's group holds the round number, and the match spans
+        # double as section boundaries so no second regex walk is needed
         rounds_found = set()
-        for pattern in round_patterns:
-            matches = re.finditer(pattern, content_lower)
-            for match in matches:
-                if match.group(1).isdigit():
-                    rounds_found.add(int(match.group(1)))
-
-        # Extract round descriptions
+        spans = []
+        for match in _ROUND_COUNT_RE.finditer(content_lower):
+            number = next((group for group in match.groups() if group), None)
+            if number:
+                rounds_found.add(int(number))
+            # Only 'round N' / 'interview N' headers mark section
+            # boundaries; a bare 'N rounds' count mention (group 2) must
+            # not split or renumber the descriptions
+            if match.group(2) is None:
+                spans.append(match.span())
+
+        # Round descriptions are the text between neighbouring matches
         round_descriptions = []
-        round_sections = re.split(r'round\s*\d+|interview\s*\d+', content, flags=re.IGNORECASE)
+        for i, (_, section_start) in enumerate(spans):
+            section_end = spans[i + 1][0] if i + 1 < len(spans) else len(content)
+            section = content[section_start:section_end]
 
-        for i, section in enumerate(round_sections[1:], 1):  # Skip first split part
             if len(section.strip()) > 50:  # Only meaningful sections
                 round_descriptions.append({
-                    'round_number': i,
+                    'round_number': i + 1,
                     'description': section[:500]  # Limit length
                 })
 
@@ -396,43 +506,21 @@ class RedditScraper(BaseScraper):
             'details': round_descriptions
         }
 
-    def _extract_difficulty_indicators(self, content: str) -> List[str]:
-        """Extract difficulty indicators from content."""
-        content_lower = content.lower()
-        difficulty_indicators = []
-
-        difficulty_patterns = {
-            'easy': ['easy', 'simple', 'basic', 'straightforward'],
-            'medium': ['medium', 'moderate', 'intermediate', 'standard'],
-            'hard': ['hard', 'difficult', 'challenging', 'tough', 'complex']
-        }
-
-        for difficulty, keywords in difficulty_patterns.items():
-            if any(keyword in content_lower for keyword in keywords):
-                difficulty_indicators.append(difficulty)
+    def _extract_difficulty_indicators(self, content_lower: str) -> List[str]:
+        """Extract difficulty indicators from pre-lowercased content."""
+        found = {match.lastgroup for match in _DIFFICULTY_RE.finditer(content_lower)}
+        return [level for level in ('easy', 'medium', 'hard') if level in found]
 
-        return difficulty_indicators
+    def _extract_outcome(self, content_lower: str) -> str:
+        """Extract interview outcome from pre-lowercased content."""
+        # Positive indicators win, matching the old check order
+        outcome = 'unknown'
+        for match in _OUTCOME_RE.finditer(content_lower):
+            if match.lastgroup == 'offer':
+                return 'offer'
+            outcome = 'rejected'
 
-    def _extract_outcome(self, content: str) -> str:
-        """Extract interview outcome."""
-        content_lower = content.lower()
-
-        positive_indicators = [
-            'got the offer', 'selected', 'hired', 'offer letter',
-            'accepted', 'joined', 'success', 'got offer', 'received offer'
-        ]
-
-        negative_indicators = [
-            'rejected', 'not selected', 'failed', 'did not get',
-            'unsuccessful', "didn't make it", 'no offer'
-        ]
-
-        if any(indicator in content_lower for indicator in positive_indicators):
-            return 'offer'
-        elif any(indicator in content_lower for indicator in negative_indicators):
-            return 'rejected'
-        else:
-            return 'unknown'
+        return outcome
 
     def _calculate_time_weight(self, experience_date: datetime) -> float:
         """Calculate time-based weight for the experience."""
@@ -440,9 +528,7 @@ class RedditScraper(BaseScraper):
         months_old = days_old / 30.44
 
         # Use exponential decay
-        import math
-        decay_lambda = Config.DECAY_LAMBDA
-        weight = math.exp(-decay_lambda * months_old)
+        weight = math.exp(-Config.DECAY_LAMBDA * months_old)
 
         # Ensure minimum weight
         return max(weight, 0.1)
\ No newline at end of file
@@ -12,9 +12,12 @@ Key Features:
 - Consistent across all platforms
 """
 
+import hashlib
 import re
 import logging
-from typing import Dict, List, Optional
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +72,47 @@ class CompanyExtractor:
             'Byju': ['byju', 'byjus', 'byju\'s'],
         }
 
+        # Company names show up in the title or the opening paragraphs
+        # almost always; bounding the scan to a head+tail window keeps
+        # the per-article cost flat for very long threads, at the cost of
+        # missing a name mentioned only mid-body
+        self.scan_head_chars = 4096
+        self.scan_tail_chars = 512
+
+        # Combined alias scanner: one linear pass over the text replaces
+        # a per-company, per-pattern regex loop (100+ scans per article)
+        self._scan_re = None
+        self._alias_to_company = {}
+        self._priority = {}
+        self._canonical_by_lower = {}
+        self._build_scanner()
+
+    def _build_scanner(self) -> None:
+        """(Re)build the combined alias scanner from company_patterns."""
+        # Normalize the table once: interned canonical names and
+        # pre-lowered interned patterns, so per-article paths compare
+        # against long-lived string objects with no fresh allocations
+        self.company_patterns = {
+            sys.intern(company): [sys.intern(p.lower()) for p in patterns]
+            for company, patterns in self.company_patterns.items()
+        }
+        self._canonical_by_lower = {
+            company.lower(): company for company in self.company_patterns
+        }
+        self._priority = {company: rank for rank, company in enumerate(self.company_patterns)}
+        self._alias_to_company = {}
+        for company, patterns in self.company_patterns.items():
+            for pattern in patterns:
+                # First owner wins, preserving the priority ordering
+                self._alias_to_company.setdefault(pattern, company)
+
+        # Longest aliases first so multi-word names beat their prefixes
+        alternation = '|'.join(
+            re.escape(alias)
+            for alias in sorted(self._alias_to_company, key=len, reverse=True)
+        )
+        self._scan_re = re.compile(r'\b(?:' + alternation + r')\b')
+
     def extract_company_from_content(self, title: str, content: str, target_company: Optional[str] = None) -> str:
         """
         Extract company name from title and content with priority-based matching.
@@ -81,57 +125,101 @@ class CompanyExtractor:
         Returns:
             Company name or "Unknown"
         """
+        if self._scan_re is None:
+            self._build_scanner()
+
+        # Combine title and content once; every check below reuses this
+        # single lowered copy instead of re-concatenating the article.
+        # Long bodies are clipped to a head+tail window
+        if len(content) > self.scan_head_chars + self.scan_tail_chars:
+            content = content[:self.scan_head_chars] + " " + content[-self.scan_tail_chars:]
+        text = (title + " " + content).lower()
+
         # If we have a target company, check it first
         if target_company:
-            extracted = self._check_target_company_first(title, content, target_company)
+            extracted = self._check_target_company_first(text, target_company)
             if extracted != "Unknown":
                 return extracted
 
-        # Combine title and content for analysis
-        text = (title + " " + content).lower()
-
-        # Use priority-based matching (first match wins)
-        for company_name, patterns in self.company_patterns.items():
-            if self._matches_company_patterns(text, patterns):
-                logger.debug(f"Company matched: {company_name}")
-                return company_name
+        # One linear scan; of all alias hits keep the owner that sits
+        # highest in the priority-ordered pattern table
+        best_rank = None
+        best_company = None
+        for match in self._scan_re.finditer(text):
+            company_name = self._alias_to_company[match.group(0)]
+            rank = self._priority[company_name]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                best_company = company_name
+
+        if best_company:
+            logger.debug("Company matched: %s", best_company)
+            return best_company
 
         # If no match found, try URL-based extraction
-        url_company = self._extract_from_url_patterns(title, content)
+        url_company = self._extract_from_url_patterns(text)
         if url_company != "Unknown":
             return url_company
 
         return "Unknown"
 
-    def _check_target_company_first(self, title: str, content: str, target_company: str) -> str:
-        """Check if content matches the target company we're scraping for."""
-        text = (title + " " + content).lower()
+    def extract_many(self, docs: List[Tuple[str, str]], target_company: Optional[str] = None) -> List[str]:
+        """
+        Extract company names for a batch of (title, content) pairs.
+
+        The combined alias scanner is compiled once up front, so a bulk
+        pass costs exactly one linear scan per document with no
+        per-document pattern setup.
+        """
+        if self._scan_re is None:
+            self._build_scanner()
+
+        return [
+            self.extract_company_from_content(title, content, target_company)
+            for title, content in docs
+        ]
+
+    def _check_target_company_first(self, text: str, target_company: str) -> str:
+        """Check if the lowered combined text matches the target company."""
         target_lower = target_company.lower()
 
         # Direct match
         if target_lower in text:
             return target_company
 
-        # Check if target company has patterns defined
-        patterns = self.company_patterns.get(target_company, [target_lower])
+        # Check if target company has patterns defined, resolving the
+        # name case-insensitively to the canonical entry
+        canonical = self._canonical_by_lower.get(target_lower, target_company)
+        patterns = self.company_patterns.get(canonical, (target_lower,))
         if self._matches_company_patterns(text, patterns):
             return target_company
 
         return "Unknown"
 
     def _matches_company_patterns(self, text: str, patterns: List[str]) -> bool:
-        """Check if text matches any of the company patterns."""
-        for pattern in patterns:
-            # Use word boundaries to avoid partial matches
-            regex_pattern = r'\b' + re.escape(pattern) + r'\b'
-            if re.search(regex_pattern, text):
+        """Check if text contains any pattern as a whole word."""
+        return any(self._literal_word_search(text, pattern) for pattern in patterns)
+
+    @staticmethod
+    def _literal_word_search(text: str, pattern: str) -> bool:
+        """Whole-word substring search without the regex engine.
+
+        Patterns are plain literals, so str.find (a C-level scan) plus a
+        check that the neighbouring characters are non-alphanumeric is
+        equivalent to the old \\b-bounded regex search.
+        """
+        i = 0
+        pat_len = len(pattern)
+        while (i := text.find(pattern, i)) != -1:
+            end = i + pat_len
+            if (i == 0 or not text[i - 1].isalnum()) and \
+                    (end == len(text) or not text[end].isalnum()):
                 return True
+            i += 1
         return False
 
-    def _extract_from_url_patterns(self, title: str, content: str) -> str:
+    def _extract_from_url_patterns(self, text: str) -> str:
         """Try to extract company from URL patterns or context clues."""
-        text = (title + " " + content).lower()
-
         # URL-based extraction patterns
         url_patterns = {
             'GeeksforGeeks': ['geeksforgeeks.org'],
@@ -150,7 +238,9 @@ class CompanyExtractor:
     def add_company_patterns(self, company_name: str, patterns: List[str]) -> None:
         """Add new company patterns dynamically."""
         self.company_patterns[company_name] = patterns
-        logger.info(f"Added patterns for {company_name}: {patterns}")
+        # Rebuild the combined scanner lazily on the next extraction
+        self._scan_re = None
+        logger.info("Added patterns for %s: %s", company_name, patterns)
 
     def get_all_companies(self) -> List[str]:
         """Get list of all supported companies."""
@@ -163,13 +253,36 @@ class CompanyExtractor:
 # Global instance
 company_extractor = CompanyExtractor()
 
+# Memoized extraction - reposts and re-classification passes see the
+# same (title, content) pairs repeatedly. Keys are 16-byte blake2b
+# digests of the text, so the cache never pins whole articles in memory
+_CACHE_MAX_ENTRIES = 8192
+_extraction_cache: OrderedDict = OrderedDict()
+
 def extract_company_from_content(title: str, content: str, target_company: Optional[str] = None) -> str:
     """Convenience function to extract company name."""
-    return company_extractor.extract_company_from_content(title, content, target_company)
+    digest = hashlib.blake2b(
+        (title + "\x00" + content).encode('utf-8', 'replace'), digest_size=16
+    ).digest()
+    key = (digest, target_company)
+
+    try:
+        _extraction_cache.move_to_end(key)
+        return _extraction_cache[key]
+    except KeyError:
+        pass
+
+    result = company_extractor.extract_company_from_content(title, content, target_company)
+    _extraction_cache[key] = result
+    if len(_extraction_cache) > _CACHE_MAX_ENTRIES:
+        _extraction_cache.popitem(last=False)
+    return result
 
 def add_company_patterns(company_name: str, patterns: List[str]) -> None:
     """Convenience function to add new company patterns."""
     company_extractor.add_company_patterns(company_name, patterns)
+    # New patterns can change prior results
+    _extraction_cache.clear()
 
 # Usage examples:
 if __name__ == "__main__":
@@ -1,9 +1,20 @@
 import time
 import random
-from collections import deque, defaultdict
+import threading
+from collections import deque
+from dataclasses import dataclass
 from typing import Dict, Optional
 import logging
 
+@dataclass(slots=True)
+class DomainState:
+    """Per-domain rate-limiting state, fetched with a single dict lookup."""
+    requests: deque
+    failures: int = 0
+    last_request: float = 0.0
+    success_streak: int = 0
+    adaptive_multiplier: float = 1.0
+
 class SmartRateLimiter:
     """
     Advanced rate limiter with multiple strategies:
@@ -17,20 +28,30 @@ class SmartRateLimiter:
         self.platform_name = platform_name
         self.logger = logging.getLogger(f'rate_limiter.{platform_name}')
         
-        # Per-domain tracking
-        self.domain_requests: Dict[str, deque] = defaultdict(deque)
-        self.domain_failures: Dict[str, int] = defaultdict(int)
-        self.domain_last_request: Dict[str, float] = {}
-        
+        # Per-domain tracking: one DomainState per domain instead of
+        # five parallel dicts hashing the same key. Request timestamps
+        # live in fixed-capacity rings (never more than one minute's
+        # quota is worth keeping), so the deques stop growing under load
+        self._domains: Dict[str, DomainState] = {}
+
+        # One limiter is shared by every worker thread of a scraper, so
+        # window checks and state updates must be atomic
+        self._lock = threading.Lock()
+
         # Configuration - Optimized for research use
         self.base_requests_per_minute = 20  # Increase from 10 to 20
         self.failure_backoff_base = 1.5    # Reduce from 2 to 1.5 for faster recovery
         self.max_backoff_time = 60         # Reduce from 300 to 60 seconds max
         self.jitter_range = (0.8, 1.2)     # Reduce jitter range
-        
-        # Adaptive parameters
-        self.success_streak: Dict[str, int] = defaultdict(int)
-        self.adaptive_multiplier: Dict[str, float] = defaultdict(lambda: 1.0)
+
+    def _domain_state(self, domain: str) -> DomainState:
+        """Get or create the tracking state for a domain."""
+        state = self._domains.get(domain)
+        if state is None:
+            state = self._domains[domain] = DomainState(
+                requests=deque(maxlen=self.base_requests_per_minute)
+            )
+        return state
     
     def wait_if_needed(self, domain: str, base_delay: int = 1):
         """
@@ -40,38 +61,57 @@ class SmartRateLimiter:
             domain: Target domain
             base_delay: Base delay from robots.txt (default reduced to 1)
         """
-        now = time.time()
+        # Check the window and claim the slot atomically: without the
+        # lock, N concurrent workers can all observe a free window and
+        # burst past the per-minute limit. The sleep happens outside the
+        # lock so waiting threads don't serialize each other.
+        with self._lock:
+            # Monotonic clock: immune to NTP jumps, and cheaper than wall time
+            now = time.monotonic()
+            state = self._domain_state(domain)
+
+            # Calculate required wait time
+            wait_time = self._calculate_wait_time(state, domain, base_delay, now)
 
-        # Calculate required wait time
-        wait_time = self._calculate_wait_time(domain, base_delay, now)
+            total_wait = 0
+            if wait_time > 0:
+                # Add jitter to prevent synchronized requests
+                jitter = random.uniform(*self.jitter_range)
+                total_wait = min(wait_time * jitter, 10)  # Cap wait time at 10 seconds
 
-        if wait_time > 0:
-            # Add jitter to prevent synchronized requests
-            jitter = random.uniform(*self.jitter_range)
-            total_wait = min(wait_time * jitter, 10)  # Cap wait time at 10 seconds
+            # Record the request at its scheduled time before releasing
+            # the lock, so later callers queue behind it
+            self._record_request(state, now + total_wait)
 
+        if total_wait > 0:
+            # %-style args defer formatting until a handler wants the record
             if total_wait > 5:  # Only log longer waits
-                self.logger.info(f"Rate limiting: waiting {total_wait:.1f}s for {domain}")
+                self.logger.info("Rate limiting: waiting %.1fs for %s", total_wait, domain)
             else:
-                self.logger.debug(f"Rate limiting: waiting {total_wait:.1f}s for {domain}")
+                self.logger.debug("Rate limiting: waiting %.1fs for %s", total_wait, domain)
             time.sleep(total_wait)
 
-        # Record this request
-        self._record_request(domain, now)
-    
-    def _calculate_wait_time(self, domain: str, base_delay: int, current_time: float) -> float:
+    def _calculate_wait_time(self, state: DomainState, domain: str,
+                             base_delay: int, current_time: float) -> float:
         """Calculate how long to wait before next request."""
-        
+        requests = state.requests
+
+        # Fast path: no backoff or adaptive penalty pending and the
+        # window is empty (or entirely stale) - the factor chain below
+        # collapses to plain arithmetic, skipping the deque scan
+        if state.failures == 0 and state.adaptive_multiplier == 1.0 and \
+                (not requests or current_time - requests[-1] > 60):
+            requests.clear()
+            return max(0, base_delay - (current_time - state.last_request))
+
         # Factor 1: Base delay from robots.txt
         wait_time = base_delay
-        
+
         # Factor 2: Sliding window rate limiting
-        requests = self.domain_requests[domain]
-        
         # Remove old requests (older than 1 minute)
         while requests and current_time - requests[0] > 60:
             requests.popleft()
-        
+
         # Check rate limit
         requests_per_minute = len(requests)
         if requests_per_minute >= self.base_requests_per_minute:
@@ -79,71 +119,74 @@ class SmartRateLimiter:
             oldest_request = requests[0] if requests else current_time
             time_until_next = 60 - (current_time - oldest_request)
             wait_time = max(wait_time, time_until_next)
-        
+
         # Factor 3: Exponential backoff for failures
-        failure_count = self.domain_failures[domain]
-        if failure_count > 0:
+        if state.failures > 0:
             backoff_time = min(
-                self.failure_backoff_base ** failure_count,
+                self.failure_backoff_base ** state.failures,
                 self.max_backoff_time
             )
             wait_time = max(wait_time, backoff_time)
-            self.logger.debug(f"Applying exponential backoff: {backoff_time}s for {domain}")
-        
+            self.logger.debug("Applying exponential backoff: %ss for %s", backoff_time, domain)
+
         # Factor 4: Adaptive delay based on success patterns
-        adaptive_mult = self.adaptive_multiplier[domain]
-        wait_time *= adaptive_mult
-        
+        wait_time *= state.adaptive_multiplier
+
         # Factor 5: Minimum delay since last request
-        last_request_time = self.domain_last_request.get(domain, 0)
-        time_since_last = current_time - last_request_time
+        time_since_last = current_time - state.last_request
         if time_since_last < wait_time:
             wait_time = wait_time - time_since_last
         else:
             wait_time = 0
-        
+
         return max(wait_time, 0)
-    
-    def _record_request(self, domain: str, timestamp: float):
+
+    def _record_request(self, state: DomainState, timestamp: float):
         """Record a request for rate limiting tracking."""
-        self.domain_requests[domain].append(timestamp)
-        self.domain_last_request[domain] = timestamp
-    
+        state.requests.append(timestamp)
+        state.last_request = timestamp
+
     def record_success(self, domain: str):
         """Record successful request for adaptive rate limiting."""
-        # Reset failure count
-        self.domain_failures[domain] = 0
-        
-        # Increase success streak
-        self.success_streak[domain] += 1
-        
-        # Gradually reduce adaptive multiplier for successful domains
-        if self.success_streak[domain] >= 5:
-            current_mult = self.adaptive_multiplier[domain]
-            self.adaptive_multiplier[domain] = max(0.8, current_mult * 0.9)
-            self.success_streak[domain] = 0
-        
-        self.logger.debug(f"Recorded success for {domain}")
-    
+        with self._lock:
+            state = self._domain_state(domain)
+
+            # Reset failure count
+            state.failures = 0
+
+            # Increase success streak
+            state.success_streak += 1
+
+            # Gradually reduce adaptive multiplier for successful domains
+            if state.success_streak >= 5:
+                state.adaptive_multiplier = max(0.8, state.adaptive_multiplier * 0.9)
+                state.success_streak = 0
+
+        self.logger.debug("Recorded success for %s", domain)
+
     def record_failure(self, domain: str):
         """Record failed request for exponential backoff."""
-        self.domain_failures[domain] += 1
-        self.success_streak[domain] = 0
-        
-        # Increase adaptive multiplier for problematic domains
-        current_mult = self.adaptive_multiplier[domain]
-        self.adaptive_multiplier[domain] = min(3.0, current_mult * 1.2)
-        
+        with self._lock:
+            state = self._domain_state(domain)
+            state.failures += 1
+            state.success_streak = 0
+
+            # Increase adaptive multiplier for problematic domains
+            state.adaptive_multiplier = min(3.0, state.adaptive_multiplier * 1.2)
+            failure_count = state.failures
+
         self.logger.warning(
-            f"Recorded failure for {domain} (count: {self.domain_failures[domain]})"
+            "Recorded failure for %s (count: %d)", domain, failure_count
         )
-    
+
     def get_stats(self) -> Dict:
         """Get rate limiting statistics."""
-        return {
-            'domains_tracked': len(self.domain_requests),
-            'total_failures': sum(self.domain_failures.values()),
-            'average_adaptive_multiplier': sum(self.adaptive_multiplier.values()) / 
-                                         max(len(self.adaptive_multiplier), 1),
-            'domains_with_failures': len([d for d, f in self.domain_failures.items() if f > 0])
-        }
\ No newline at end of file
+        with self._lock:
+            states = list(self._domains.values())
+            return {
+                'domains_tracked': len(states),
+                'total_failures': sum(s.failures for s in states),
+                'average_adaptive_multiplier': sum(s.adaptive_multiplier for s in states) /
+                                             max(len(states), 1),
+                'domains_with_failures': sum(1 for s in states if s.failures > 0)
+            }
\ No newline at end of file
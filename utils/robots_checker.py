@@ -2,6 +2,9 @@ import requests
 from urllib.robotparser import RobotFileParser
 from urllib.parse import urlparse
 import logging
+import sqlite3
+import threading
+from pathlib import Path
 from typing import Tuple, Optional
 import time
 
@@ -10,12 +13,26 @@ class RobotsTxtChecker:
     Professional robots.txt compliance checker with caching and proper error handling.
     Ensures ethical scraping practices.
     """
-    
-    def __init__(self):
+
+    def __init__(self, cache_dir: str = 'logs'):
         self.cache = {}
         self.cache_ttl = {}
         self.cache_duration = 3600  # 1 hour cache
         self.logger = logging.getLogger(__name__)
+
+        # Disk-backed cache so a fresh run skips one robots.txt fetch for
+        # every domain a previous run already checked
+        cache_path = Path(cache_dir)
+        cache_path.mkdir(exist_ok=True)
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(
+            cache_path / 'robots_cache.db',
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS robots (domain TEXT PRIMARY KEY, body TEXT, ts REAL)"
+        )
     
     def can_fetch(self, url: str, user_agent: str = '*') -> Tuple[bool, int]:
         """
@@ -66,6 +83,10 @@ class RobotsTxtChecker:
     
     def _load_robots_txt(self, domain: str):
         """Load and parse robots.txt for a domain."""
+        # A fresh copy persisted by an earlier run saves the HTTP fetch
+        if self._load_from_disk(domain):
+            return
+
         try:
             robots_url = f"https://{domain}/robots.txt"
             self.logger.debug(f"Loading robots.txt from {robots_url}")
@@ -74,17 +95,19 @@ class RobotsTxtChecker:
             if response.status_code == 200:
                 rp = RobotFileParser()
                 rp.set_url(robots_url)
-                
-                # Parse the content line by line
-                for line in response.text.split('\n'):
-                    rp.read()
-                
+
+                # Parse the body we already fetched; rp.read() would
+                # re-download robots.txt itself
+                rp.parse(response.text.splitlines())
+
                 self.cache[domain] = rp
                 self.cache_ttl[domain] = time.time()
+                self._store_to_disk(domain, response.text, self.cache_ttl[domain])
                 self.logger.info(f"Successfully loaded robots.txt for {domain}")
             else:
                 self.cache[domain] = None
                 self.cache_ttl[domain] = time.time()
+                self._store_to_disk(domain, None, self.cache_ttl[domain])
                 self.logger.info(f"No robots.txt found for {domain} (HTTP {response.status_code})")
                 
         except Exception as e:
@@ -92,8 +115,50 @@ class RobotsTxtChecker:
             self.cache[domain] = None
             self.cache_ttl[domain] = time.time()
     
+    def _load_from_disk(self, domain: str) -> bool:
+        """Restore a still-fresh cached robots.txt from disk, if any."""
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT body, ts FROM robots WHERE domain = ?", (domain,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Robots cache read failed for {domain}: {e}")
+            return False
+
+        if not row or time.time() - row[1] >= self.cache_duration:
+            return False
+
+        body, ts = row
+        if body is None:
+            # Previous run saw no robots.txt for this domain
+            self.cache[domain] = None
+        else:
+            rp = RobotFileParser()
+            rp.set_url(f"https://{domain}/robots.txt")
+            rp.parse(body.splitlines())
+            self.cache[domain] = rp
+        self.cache_ttl[domain] = ts
+        return True
+
+    def _store_to_disk(self, domain: str, body: Optional[str], ts: float):
+        """Persist a fetched robots.txt (or its absence) for later runs."""
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO robots (domain, body, ts) VALUES (?, ?, ?)",
+                    (domain, body, ts)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Robots cache write failed for {domain}: {e}")
+
     def clear_cache(self):
         """Clear the robots.txt cache."""
         self.cache.clear()
         self.cache_ttl.clear()
+        try:
+            with self._db_lock:
+                self._db.execute("DELETE FROM robots")
+        except sqlite3.Error as e:
+            self.logger.warning(f"Robots cache clear failed: {e}")
         self.logger.info("Robots.txt cache cleared")
\ No newline at end of file